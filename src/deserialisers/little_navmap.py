@@ -4,7 +4,7 @@ It includes:
 1. Pydantic models to represent the structure of flight plans, including headers, waypoints,
    navigation data, simulation data, and aircraft performance specifics.
 2. A `read` method to load flight plan data from an XML file.
-3. A `write` method to save flight plan data back to XML format.
+3. A `write` method to save flight plan data back to XML format, to a file or a stream.
 4. Utility functions to handle XML serialization and cleanup.
 
 The primary purpose of this module is to enable structured and validated data manipulation
@@ -12,6 +12,7 @@ for LittleNavmap flight planning software.
 """
 
 from pathlib import Path
+from typing import BinaryIO
 
 import xmltodict
 from pydantic import BaseModel, Field, RootModel, field_validator
@@ -121,6 +122,7 @@ class Pos(BaseModel):
     Methods:
         float_to_int(value): Validates and transforms the altitude (`Alt`) field, converting it to an integer if
                             it's provided as a string or a float.
+        clone(): Returns an independent copy of the position.
     """
 
     Lon: float = Field(alias="@Lon")
@@ -162,6 +164,17 @@ class Pos(BaseModel):
             return int(value)
         return value
 
+    def clone(self) -> "Pos":
+        """Returns an independent copy of the position.
+
+        All fields are immutable scalars, so a shallow copy is sufficient and avoids the
+        overhead of `copy.deepcopy`.
+
+        Returns:
+            Pos: A new `Pos` with the same longitude, latitude, and altitude.
+        """
+        return self.model_copy()
+
 
 def __repr__(self: Pos) -> str:  # noqa: N807
     return f'Pos(**{{"@Lon": {self.Lon}, "@Lat": {self.Lat}, "@Alt": {self.Alt}}})'
@@ -180,6 +193,7 @@ class Waypoint(BaseModel):
 
     Methods:
         __repr__(): Returns a string representation of the Waypoint object for debugging purposes.
+        clone(): Returns an independent copy of the waypoint.
     """
 
     Name: str | None = None
@@ -211,6 +225,18 @@ class Waypoint(BaseModel):
             f")"
         )
 
+    def clone(self) -> "Waypoint":
+        """Returns an independent copy of the waypoint.
+
+        The copy has its own `Pos`, so either waypoint can be modified without affecting
+        the other. This is much cheaper than `copy.deepcopy`, which walks the model
+        through the generic copy protocol.
+
+        Returns:
+            Waypoint: A new `Waypoint` with the same field values.
+        """
+        return self.model_copy(update={"Pos": self.Pos.clone()})
+
 
 class Flightplan(BaseModel):
     """Represents a complete flight plan.
@@ -260,6 +286,9 @@ class LittleNavmap(BaseModel):
     def read(cls, file_path: Path) -> "LittleNavmap":
         """Create an instance of LittleNavmap from an XML file.
 
+        The file is parsed incrementally by xmltodict's expat parser, which decodes it
+        according to its XML declaration.
+
         Args:
             file_path (str): Path to the XML file.
 
@@ -270,10 +299,11 @@ class LittleNavmap(BaseModel):
         if not file_path.exists():
             raise FileNotFoundError(f"The file {file_path} does not exist.")
 
-        # Parse the XML file
-        with file_path.open("r", encoding="utf-8") as file:
+        # Parse the XML file, streaming the raw bytes to the parser so that the file is
+        # neither decoded nor read into memory as a whole first
+        with file_path.open("rb") as file:
             try:
-                xml_data = xmltodict.parse(file.read())
+                xml_data = xmltodict.parse(file)
             except Exception as e:
                 raise ValueError(f"Failed to parse the XML file: {e}") from e
 
@@ -291,13 +321,23 @@ class LittleNavmap(BaseModel):
         # Create and return the Flightplan instance
         return cls.model_validate(xml_data.get("LittleNavmap", {}))
 
-    def write(self, file_path: Path) -> None:
-        """Write the XML file to disk.
+    def write(self, file_path: Path | BinaryIO) -> None:
+        """Write the XML file to disk, or to a binary file-like object.
 
-        :param file_path:
-        :return: None
+        Args:
+            file_path (Path | BinaryIO): Path of the file to write, or an object with a
+                `write(bytes)` method, such as an open binary file or `io.BytesIO`,
+                that receives the UTF-8 encoded XML.
         """
         serialized_xml = serialize_to_xml(self)
+
+        if hasattr(file_path, "write"):
+            try:
+                file_path.write(serialized_xml.encode("utf-8"))
+            except Exception as e:
+                raise ValueError(f"Failed to write the XML file: {e}") from e
+            return
+
         with open(file_path, "w") as f:
             try:
                 f.write(serialized_xml)
@@ -308,8 +348,9 @@ class LittleNavmap(BaseModel):
 # Serialization and XML handling
 def serialize_to_xml(model: BaseModel) -> str:
     """Serialize a Pydantic model back to an XML string."""
-    # Convert Pydantic model to dictionary using aliases
-    model_dict = model.model_dump(by_alias=True)
+    # Convert Pydantic model to dictionary using aliases, leaving out None values as the
+    # dump is built rather than walking the dictionary again afterwards
+    model_dict = model.model_dump(by_alias=True, exclude_none=True)
 
     # Handle Waypoints: Wrapping list as a single dictionary for serialization
     flightplan = model_dict.get("Flightplan", {})
@@ -320,20 +361,8 @@ def serialize_to_xml(model: BaseModel) -> str:
             "Waypoint": waypoints,
         }  # Wrap into <Waypoints><Waypoint></Waypoint></Waypoints>
 
-    # Remove None values from the entire model dictionary
-    model_dict = remove_none_values(model_dict)
-
     # Wrap everything in the root <LittleNavmap> tag
     xml_dict = {"LittleNavmap": model_dict}
 
     # Serialize back to XML
     return xmltodict.unparse(xml_dict, pretty=True)
-
-
-def remove_none_values(obj: dict) -> dict:
-    """Recursively remove keys with None values from a dictionary."""
-    if isinstance(obj, dict):
-        return {k: remove_none_values(v) for k, v in obj.items() if v is not None}
-    if isinstance(obj, list):
-        return [remove_none_values(v) for v in obj]
-    return obj
@@ -3,6 +3,8 @@
 Features:
 - Represents segments between waypoints with attributes such as starting and ending positions.
 - Calculates distances, true bearings, and magnetic bearings between waypoints.
+- Exposes the scalar distance and bearing kernels as plain functions of coordinates.
+- Computes distance and bearing together in one fused kernel, shared by `Segment`.
 - Integrates with pygeomag to account for Earth's magnetic declination.
 - Offers computations for travel times based on speed and other utilities.
 
@@ -12,6 +14,7 @@ Dependencies:
 """
 
 import math
+from functools import cached_property
 
 from pygeomag import GeoMag
 
@@ -25,6 +28,9 @@ RADIUS_OF_EARTH = 3440.065  # Earth's radius in nautical miles
 class Segment:
     """Represents a segment connecting two waypoints.
 
+    The geometric properties are cached on first access, so the waypoints' positions
+    must not be modified once the segment is in use.
+
     Attributes:
         start (Waypoint): The starting waypoint of the segment.
         end (Waypoint): The ending waypoint of the segment.
@@ -51,72 +57,72 @@ class Segment:
         """
         return f"Segment(start={self.start}, end={self.end}, length={self.length:.2f})"
 
-    @property
+    @cached_property
+    def distance_and_bearing(self) -> tuple[float, float]:
+        """The flat earth distance and unrounded true bearing of the segment.
+
+        Both are computed together by `compute_distance_and_bearing` on first access,
+        so `length` and `true_bearing` share one conversion of the coordinates.
+
+        Returns:
+            tuple[float, float]: The distance in nautical miles and the true bearing in
+            degrees, in the range [0, 360).
+        """
+        return compute_distance_and_bearing(
+            self.start.Pos.Lat,
+            self.start.Pos.Lon,
+            self.end.Pos.Lat,
+            self.end.Pos.Lon,
+        )
+
+    @cached_property
     def length(self) -> float:
         """Computes the flat earth distance between the start and end waypoints.
 
         The calculation assumes a spherical Earth and uses an approximation of
-        the Haversine formula for flat distances over short arcs.
+        the Haversine formula for flat distances over short arcs. It is computed on
+        first access and cached.
 
         Returns:
             float: The distance in nautical miles.
         """
-        lat1, lon1, lat2, lon2 = map(
-            math.radians,
-            [
-                self.start.Pos.Lat,
-                self.start.Pos.Lon,
-                self.end.Pos.Lat,
-                self.end.Pos.Lon,
-            ],
-        )
+        return self.distance_and_bearing[0]
 
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
+    @cached_property
+    def delta_lat_lon(self) -> tuple[float, float]:
+        """The latitude and longitude deltas from the start to the end waypoint.
 
-        x = dlon * math.cos((lat1 + lat2) / 2)
+        These are constant for a segment, so they are computed once and reused by every
+        flat earth interpolation along it.
 
-        return RADIUS_OF_EARTH * math.sqrt(x * x + dlat * dlat)
+        Returns:
+            tuple[float, float]: The (latitude, longitude) deltas in decimal degrees.
+        """
+        return (
+            self.end.Pos.Lat - self.start.Pos.Lat,
+            self.end.Pos.Lon - self.start.Pos.Lon,
+        )
 
-    @property
+    @cached_property
     def true_bearing(self) -> int:
         """Calculates the true bearing between the start and end waypoints.
 
         True bearing is the compass direction from the start waypoint to the
-        end waypoint relative to true north.
+        end waypoint relative to true north. It is computed on first access and
+        cached, as it is read repeatedly while planning the transit.
 
         Returns:
             int: The true bearing in degrees (0-359).
         """
-        lat1, lon1, lat2, lon2 = map(
-            math.radians,
-            [
-                self.start.Pos.Lat,
-                self.start.Pos.Lon,
-                self.end.Pos.Lat,
-                self.end.Pos.Lon,
-            ],
-        )
-
-        dlon = lon2 - lon1
+        return round(self.distance_and_bearing[1] % 360)
 
-        y = math.sin(dlon) * math.cos(lat2)
-        x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(
-            lat2,
-        ) * math.cos(dlon)
-
-        bearing = math.atan2(y, x)
-        bearing = math.degrees(bearing)
-        bearing = (bearing + 360) % 360
-
-        return round(bearing % 360)
-
-    @property
+    @cached_property
     def magnetic_bearing(self) -> int:
         """Calculates the magnetic bearing between start and end waypoints.
 
         The magnetic bearing takes into account the magnetic declination at the
-        midpoint of the segment.
+        midpoint of the segment. The declination model is costly to evaluate, so the
+        bearing is computed on first access and cached.
 
         Returns:
             int: The magnetic bearing in degrees (0-359).
@@ -139,6 +145,96 @@ class Segment:
         return (self.length / speed_kts) * 3600
 
 
+def compute_flat_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Computes the flat earth distance between two points.
+
+    The calculation assumes a spherical Earth and uses an equirectangular approximation,
+    which is accurate for the short legs of a navigation route.
+
+    Args:
+        lat1 (float): The latitude of the first point in decimal degrees.
+        lon1 (float): The longitude of the first point in decimal degrees.
+        lat2 (float): The latitude of the second point in decimal degrees.
+        lon2 (float): The longitude of the second point in decimal degrees.
+
+    Returns:
+        float: The distance in nautical miles.
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    x = dlon * math.cos((lat1 + lat2) / 2)
+
+    return RADIUS_OF_EARTH * math.sqrt(x * x + dlat * dlat)
+
+
+def compute_true_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Computes the initial true bearing from one point to another.
+
+    Args:
+        lat1 (float): The latitude of the first point in decimal degrees.
+        lon1 (float): The longitude of the first point in decimal degrees.
+        lat2 (float): The latitude of the second point in decimal degrees.
+        lon2 (float): The longitude of the second point in decimal degrees.
+
+    Returns:
+        float: The true bearing in degrees, in the range [0, 360).
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+
+    dlon = lon2 - lon1
+
+    y = math.sin(dlon) * math.cos(lat2)
+    x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(
+        lat2,
+    ) * math.cos(dlon)
+
+    bearing = math.atan2(y, x)
+    bearing = math.degrees(bearing)
+
+    return (bearing + 360) % 360
+
+
+def compute_distance_and_bearing(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+) -> tuple[float, float]:
+    """Computes the flat earth distance and initial true bearing between two points.
+
+    This fuses `compute_flat_distance` and `compute_true_bearing`, converting the
+    coordinates to radians once and sharing the longitude delta. The results are
+    identical to calling the two kernels separately.
+
+    Args:
+        lat1 (float): The latitude of the first point in decimal degrees.
+        lon1 (float): The longitude of the first point in decimal degrees.
+        lat2 (float): The latitude of the second point in decimal degrees.
+        lon2 (float): The longitude of the second point in decimal degrees.
+
+    Returns:
+        tuple[float, float]: The distance in nautical miles and the true bearing in
+        degrees, in the range [0, 360).
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    x = dlon * math.cos((lat1 + lat2) / 2)
+    distance = RADIUS_OF_EARTH * math.sqrt(x * x + dlat * dlat)
+
+    cos_lat2 = math.cos(lat2)
+    y = math.sin(dlon) * cos_lat2
+    x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * cos_lat2 * math.cos(dlon)
+    bearing = math.degrees(math.atan2(y, x))
+
+    return distance, (bearing + 360) % 360
+
+
 def get_magnetic_declination(lat: float, lon: float) -> float:
     """Calculates the magnetic declination for a given geographic location.
 
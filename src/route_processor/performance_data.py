@@ -1,5 +1,6 @@
 """Handles computing jet climb and descent performance for a given flight level."""
 
+import functools
 import os
 from enum import Enum
 from pathlib import Path
@@ -139,16 +140,13 @@ def get_climb_descent_performance_data(
                                      and the operation type.
 
     Process:
-        1. Loads a pre-defined data source for the given operation using the `load_df` function.
-        2. Transforms and prepares the dataframe, including:
-           - Converting time values into seconds using `mmss_to_seconds`.
-           - Dropping unnecessary columns and sorting by flight level.
-        3. Searches the dataset for the specified `flight_level` using the `lookup_fl` function.
-        4. Constructs a `ClimbDescentPerformanceData` object with the retrieved performance metrics.
+        1. Gets the prepared table for the given operation using the `load_performance_table`
+           function, which converts time values into seconds and sorts by flight level.
+        2. Searches the dataset for the specified `flight_level` using the `lookup_fl` function.
+        3. Constructs a `ClimbDescentPerformanceData` object with the retrieved performance metrics.
 
     Notes:
-        - The function assumes that the `load_df` function loads data based on the operation type.
-        - The `mmss_to_seconds` helper converts time recorded in "MM:SS" format into seconds.
+        - The table is read from disk and prepared once per process, then reused.
         - The `lookup_fl` helper retrieves performance data corresponding to the flight level.
 
     Raises:
@@ -163,13 +161,7 @@ def get_climb_descent_performance_data(
         # Output: ClimbDescentPerformanceData containing metrics for climb at FL330.
         ```
     """
-    df = load_df(operation)
-
-    # Prepare the dataframe
-    df["time_secs"] = df["time"].apply(mmss_to_seconds)
-    df = df.drop(columns=["time"])
-    df = df.sort_values(by="fl").reset_index(drop=True)
-
+    df = load_performance_table(operation)
     result = lookup_fl(df, flight_level)
 
     # Create and return a PerformanceData object
@@ -200,10 +192,10 @@ def get_ll_cruise_performance_data(
                                  including fuel consumption rate (`kg_min`) and the operation type.
 
     Process:
-        1. Loads cruise data for the given operation using the `load_df` function.
-        2. Sorts the data by airspeed (`kts`).
-        3. Searches for the entry corresponding to the specified `speed_kts` using the `lookup_kts` function.
-        4. Constructs an `LLCruisePerformanceData` object with the retrieved fuel consumption rate
+        1. Gets the cruise table for the given operation, sorted by airspeed (`kts`), using the
+           `load_performance_table` function.
+        2. Searches for the entry corresponding to the specified `speed_kts` using the `lookup_kts` function.
+        3. Constructs an `LLCruisePerformanceData` object with the retrieved fuel consumption rate
            and the operation type.
 
     Notes:
@@ -221,8 +213,7 @@ def get_ll_cruise_performance_data(
         # Output: LLCruisePerformanceData containing metrics for cruise at 250 knots airspeed.
         ```
     """
-    df = load_df(operation)
-    df = df.sort_values(by="kts").reset_index(drop=True)
+    df = load_performance_table(operation)
     result = lookup_kts(df, speed_kts)
 
     return LLCruisePerformanceData(
@@ -254,10 +245,10 @@ def get_ml_cruise_performance_data(
                                  - The operation type.
 
     Process:
-        1. Loads cruise performance data based on the operation using the `load_df` function.
-        2. Sorts the dataset by flight level (`fl`).
-        3. Searches for the entry corresponding to the specified flight level using the `lookup_fl` function.
-        4. Constructs and returns an `MLCruisePerformanceData` object, with key metrics rounded to two decimal places.
+        1. Gets the cruise table for the given operation, sorted by flight level (`fl`), using the
+           `load_performance_table` function.
+        2. Searches for the entry corresponding to the specified flight level using the `lookup_fl` function.
+        3. Constructs and returns an `MLCruisePerformanceData` object, with key metrics rounded to two decimal places.
 
     Notes:
         - Fuel consumption (`kg_min`) and fuel efficiency (`kg_anm`) are rounded to enhance precision.
@@ -275,8 +266,7 @@ def get_ml_cruise_performance_data(
         # Output: MLCruisePerformanceData containing metrics for cruise at FL300.
         ```
     """
-    df = load_df(operation)
-    df = df.sort_values(by="fl").reset_index(drop=True)
+    df = load_performance_table(operation)
     result = lookup_fl(df, flight_level)
 
     return MLCruisePerformanceData(
@@ -353,6 +343,33 @@ def load_df(operation: JetOperation) -> pd.DataFrame:
     return df
 
 
+@functools.cache
+def load_performance_table(operation: JetOperation) -> pd.DataFrame:
+    """Loads and prepares the performance table for an operation, once per process.
+
+    The CSV file is read with `load_df` on the first call for each operation. Times in
+    "MM:SS" format are converted into a `time_secs` column, and the rows are sorted by the
+    lookup key (`kts` for airspeed tables, otherwise `fl`). Later calls return the same
+    DataFrame without touching the disk.
+
+    Args:
+        operation (JetOperation): The operation whose table is required.
+
+    Returns:
+        pandas.DataFrame: The prepared table. It is shared between callers and must not
+                          be modified.
+    """
+    df = load_df(operation)
+
+    if "time" in df.columns:
+        df["time_secs"] = df["time"].apply(mmss_to_seconds)
+        df = df.drop(columns=["time"])
+
+    key = "kts" if "kts" in df.columns else "fl"
+
+    return df.sort_values(by=key).reset_index(drop=True)
+
+
 def lookup_fl(df: pd.DataFrame, flight_level: int) -> pd.DataFrame:
     """Looks up or interpolates performance data for a specified flight level.
 
@@ -4,21 +4,27 @@ It inserts TOC and BOD waypoints, and renames all waypoints to reflect arrival t
 """
 
 import dataclasses
-from copy import deepcopy
-from itertools import pairwise
+import functools
+from itertools import accumulate, pairwise
 
-from src.deserialisers.little_navmap import Waypoint
+from src.deserialisers.little_navmap import Pos, Waypoint
 from src.route_processor.geo import Segment
 from src.route_processor.transit_planner import (
-    TransitBuilder,
     _compute_transit_segments,
+    build_transit,
 )
 from src.route_processor.utils import mins_secs_str
 
+# Hashable form of a route: (Name, Ident, Type, Region, Comment, Lon, Lat, Alt) per waypoint
+RouteKey = tuple[
+    tuple[str | None, str, str, str | None, str | None, float, float, int],
+    ...,
+]
+
 # --Public methods-----------------------------------------------------------------
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class ProcessorConfig:
     """Configuration class for processing flight data.
 
@@ -43,6 +49,8 @@ class ProcessorConfig:
           indices in the relevant flight planning system or dataset.
         - The `route_alt_ft` parameter defaults to 500 feet but can be adjusted
           based on operational needs.
+        - The config is frozen so that it can be used as a cache key by
+          `process_route_cached`.
 
     Example:
         ```python
@@ -95,10 +103,9 @@ def process_route(route: list[Waypoint], config: ProcessorConfig) -> list[Waypoi
 
     Process:
         1. **Transit Waypoints:**
-           - Compute transit route segments using `_compute_route_segments`, which determines key route-related properties like bearings.
-           - Extract `departure_bearing_mag` from the first segment for transit calculations.
+           - Compute `departure_bearing_mag` from the low level entry segment for transit calculations.
            - Compute transit segments up to the entry waypoint using `_compute_transit_segments`, based on the entry configuration (`id_entry`).
-           - Use a `TransitBuilder` to generate the transit waypoints, including:
+           - Use `build_transit`, which drives a `TransitBuilder`, to generate the transit waypoints, including:
              - Start waypoint
              - Top-of-climb (TOC) waypoint
              - Intermediate waypoints
@@ -108,12 +115,14 @@ def process_route(route: list[Waypoint], config: ProcessorConfig) -> list[Waypoi
 
         2. **Route Waypoints:**
            - Compute waypoints specific to the low-level route using `_compute_route_wps` and the configuration object.
-           - Copy or retain route waypoints during processing, depending on the type of waypoint (dictionary or object).
            - Append the route waypoints to the list of processed waypoints.
 
+        Both sets of waypoints are freshly built, so they are assembled into the result
+        list in one step without further copying.
+
     Notes:
-        - The function relies on several external helper functions (_compute_route_segments,
-          _compute_transit_segments, and _compute_route_wps) to handle complex waypoint
+        - The function relies on several external helper functions (_compute_transit_segments
+          and _compute_route_wps) to handle complex waypoint
           and segment calculations.
         - The `TransitBuilder` class is used to streamline the generation of waypoints
           for the transit segment.
@@ -144,7 +153,7 @@ def process_route(route: list[Waypoint], config: ProcessorConfig) -> list[Waypoi
         ```
 
     Dependencies:
-        - `_compute_route_segments`, `_compute_transit_segments`, `_compute_route_wps`:
+        - `_compute_transit_segments`, `_compute_route_wps`:
           Helper functions that calculate various route-specific details, such as
           segments and waypoints.
         - `TransitBuilder`: A class for building transit waypoint segments based
@@ -155,46 +164,91 @@ def process_route(route: list[Waypoint], config: ProcessorConfig) -> list[Waypoi
           arise from the helper functions or `TransitBuilder` if the inputs or
           configurations are invalid.
     """
-    processed_wps = []
-
     # Transit WPs
 
-    route_segments = _compute_route_segments(route, config)
-    departure_bearing_mag = route_segments[0].magnetic_bearing
+    entry_segment = Segment(route[config.id_entry - 1], route[config.id_entry])
+    departure_bearing_mag = entry_segment.magnetic_bearing
 
     transit_segments = _compute_transit_segments(route, config.id_entry)
-    builder = TransitBuilder(
-        transit_segments,
-        config.transit_airspeed_kts,
-        config.route_alt_ft,
-        departure_bearing_mag,
-    )
-
-    transit_wps = (
-        builder.set_start().set_toc().set_intermediate_wps().set_tod().set_end().build()
-    )
-
-    processed_wps.extend(
-        [
-            transit_wps.start_wp,
-            transit_wps.toc_wp,
-            *transit_wps.intermediate_wps,
-            transit_wps.tod_wp,
-            transit_wps.end_wp,
-        ],
+    transit_wps = build_transit(
+        (
+            transit_segments,
+            config.transit_airspeed_kts,
+            config.route_alt_ft,
+            departure_bearing_mag,
+        ),
     )
 
     # Route WPs
 
     route_wps = _compute_route_wps(route, config)
-    processed_wps.extend(
-        [
-            element.copy() if isinstance(element, dict) else element
-            for element in route_wps
-        ],
+
+    return [
+        transit_wps.start_wp,
+        transit_wps.toc_wp,
+        *transit_wps.intermediate_wps,
+        transit_wps.tod_wp,
+        transit_wps.end_wp,
+        *route_wps,
+    ]
+
+
+def route_key(route: list[Waypoint]) -> RouteKey:
+    """Converts a route into the hashable key used by `process_route_cached`.
+
+    Args:
+        route (list[Waypoint]): The route to convert.
+
+    Returns:
+        RouteKey: A tuple of `(Name, Ident, Type, Region, Comment, Lon, Lat, Alt)` tuples,
+            one per waypoint.
+    """
+    return tuple(
+        (
+            wp.Name,
+            wp.Ident,
+            wp.Type,
+            wp.Region,
+            wp.Comment,
+            wp.Pos.Lon,
+            wp.Pos.Lat,
+            wp.Pos.Alt,
+        )
+        for wp in route
     )
 
-    return processed_wps
+
+@functools.lru_cache(maxsize=32)
+def process_route_cached(
+    key: RouteKey,
+    config: ProcessorConfig,
+) -> tuple[Waypoint, ...]:
+    """Memoised `process_route` for repeated (route, config) pairs.
+
+    Re-planning the same route, e.g. during iterative edits, returns the previously
+    processed waypoints without recomputing the transit and route legs.
+
+    Args:
+        key (RouteKey): The route, converted once with `route_key`.
+        config (ProcessorConfig): The route processor configuration.
+
+    Returns:
+        tuple[Waypoint, ...]: The processed waypoints. These are shared between cache
+            hits, so callers that mutate them must copy them first.
+    """
+    route = [
+        Waypoint(
+            Name=name,
+            Ident=ident,
+            Type=type_,
+            Region=region,
+            Comment=comment,
+            Pos=Pos(**{"@Lon": lon, "@Lat": lat, "@Alt": alt}),
+        )
+        for name, ident, type_, region, comment, lon, lat, alt in key
+    ]
+
+    return tuple(process_route(route, config))
 
 
 # --Private methods-----------------------------------------------------------------
@@ -204,46 +258,83 @@ def _compute_route_wps(
     route: list[Waypoint],
     config: ProcessorConfig,
 ) -> list[Waypoint]:
-    """Compute the route waypoints."""
-    route_wps = []
-    segments = _compute_route_segments(route, config)
-    cum_time_secs = 0
-    wp_idx = 1
-
-    for this_segment, next_segment in pairwise(segments):
-        segment_time_secs = this_segment.travel_time_secs(config.route_airspeed_kts)
-        cum_time_secs += segment_time_secs
-        departure_brg = next_segment.magnetic_bearing
+    """Compute the route waypoints.
 
-        wp = deepcopy(this_segment.end)
-
-        ident = f"{mins_secs_str(cum_time_secs)}/{departure_brg:03}"
-        if wp.Comment is not None:
-            ident += f"/{wp.Comment}"
-
-        wp.Type = "WAYPOINT"
-        wp.Ident = ident
-        wp.Comment = f"WP{wp_idx}"
-        wp.Pos.Alt = config.route_alt_ft
-
-        route_wps.append(wp)
-        wp_idx += 1
+    Arrival times and departure bearings are computed for every waypoint first, and the
+    idents are then formatted from them in a single pass.
+    """
+    segments = _compute_route_segments(route, config)
+    arrival_segments = segments[:-1]
 
-    return route_wps
+    # Numeric pass
+    cum_times_secs = accumulate(
+        segment.travel_time_secs(config.route_airspeed_kts)
+        for segment in arrival_segments
+    )
+    departure_brgs = [segment.magnetic_bearing for segment in segments[1:]]
+
+    # String pass
+    idents = [
+        f"{mins_secs_str(cum_time_secs)}/{departure_brg:03}"
+        for cum_time_secs, departure_brg in zip(
+            cum_times_secs,
+            departure_brgs,
+            strict=True,
+        )
+    ]
+
+    return [
+        _clone_waypoint(
+            segment.end,
+            alt=config.route_alt_ft,
+            ident=ident
+            if segment.end.Comment is None
+            else f"{ident}/{segment.end.Comment}",
+            comment=f"WP{wp_idx}",
+        )
+        for wp_idx, (segment, ident) in enumerate(
+            zip(arrival_segments, idents, strict=True),
+            start=1,
+        )
+    ]
 
 
 def _compute_route_segments(
     route: list[Waypoint],
     config: ProcessorConfig,
 ) -> list[Segment]:
-    """Compute the segments of the route from the config data."""
-    segments = []
+    """Compute the segments of the route from the config data.
+
+    Each waypoint is cloned once, and adjacent segments share the clone that joins them.
+    """
     start_idx = config.id_entry - 1
     end_idx = (
         config.id_exit
     )  # We go one beyond to allow the departure bearing to be computed
 
-    for i in range(start_idx, end_idx):
-        segments.append(Segment(deepcopy(route[i]), deepcopy(route[i + 1])))
+    waypoints = [wp.clone() for wp in route[start_idx : end_idx + 1]]
 
-    return segments
+    return [Segment(start, end) for start, end in pairwise(waypoints)]
+
+
+def _clone_waypoint(
+    wp: Waypoint,
+    *,
+    alt: int,
+    ident: str,
+    comment: str | None,
+    type_: str = "WAYPOINT",
+) -> Waypoint:
+    """Copy a waypoint with a new type, ident, comment and altitude.
+
+    A shallow copy with a fresh `Pos` is sufficient because only these fields change,
+    and it avoids the recursive walk of a `deepcopy`.
+    """
+    return wp.model_copy(
+        update={
+            "Type": type_,
+            "Ident": ident,
+            "Comment": comment,
+            "Pos": wp.Pos.model_copy(update={"Alt": alt}),
+        },
+    )
@@ -1,7 +1,9 @@
 """Logic for planning the transit phase."""
 
 import math
-from copy import deepcopy
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, pairwise
 
 from src.deserialisers.little_navmap import Pos, Waypoint
 from src.route_processor.geo import Segment
@@ -12,6 +14,15 @@ from src.route_processor.performance_data import (
 )
 from src.route_processor.utils import interpolate_lat_lon_flat, mins_secs_str
 
+# Positional arguments of `TransitBuilder`: (transit_segments, transit_groundspeed_kts,
+# route_alt_ft, departure_bearing_mag)
+TransitArgs = tuple[list[Segment], int, int, int]
+
+_D2R = math.pi / 180.0  # Degrees to radians, the factor `math.radians` applies
+_PARALLEL_SPREAD_DEG = (
+    5  # Bearing spread below which transit legs are averaged directly
+)
+
 
 class Transit:
     """Represents a transit segment of a flight route.
@@ -20,6 +31,8 @@ class Transit:
     including the start and end waypoints, top-of-climb (TOC), top-of-descent (TOD), and any
     intermediate waypoints.
 
+    The class declares `__slots__`, so instances carry no per-instance `__dict__`.
+
     Attributes:
         start_wp (Waypoint):
             The waypoint marking the beginning of the transit segment.
@@ -60,6 +73,8 @@ class Transit:
         ```
     """
 
+    __slots__ = ("end_wp", "intermediate_wps", "start_wp", "toc_wp", "tod_wp")
+
     start_wp: Waypoint
     toc_wp: Waypoint
     intermediate_wps: list[Waypoint]
@@ -283,6 +298,15 @@ class TransitBuilder:
             ```
         """
         self.transit_segments = transit_segments
+        # Per-segment lengths and bearings, read in one pass and shared by every computation
+        seg_lengths: list[float] = []
+        seg_bearings: list[int] = []
+        for segment in transit_segments:
+            seg_lengths.append(segment.length)
+            seg_bearings.append(segment.true_bearing)
+        self._seg_lengths = tuple(seg_lengths)
+        self._seg_bearings = tuple(seg_bearings)
+        self._total_length_nm = sum(self._seg_lengths)
         self.transit_groundspeed_kts = transit_groundspeed_kts
         self.route_alt_ft = route_alt_ft
         self.departure_bearing_mag = departure_bearing_mag
@@ -303,15 +327,19 @@ class TransitBuilder:
         self,
     ) -> "TransitBuilder":
         """Start waypoint displays the departure bearing to the next waypoint."""
-        departure_segment = self.transit_segments[0]
-        departure_bearing = round(departure_segment.true_bearing)
+        departure_bearing = round(self._seg_bearings[0])
 
         ident = f"0:00/{departure_bearing:03}"
 
-        self.start_wp = deepcopy(departure_segment.start)
-        self.start_wp.Type = "WAYPOINT"
-        self.start_wp.Ident = ident
-        self.start_wp.Comment = "START"
+        start = self.transit_segments[0].start
+        self.start_wp = Waypoint(
+            Type="WAYPOINT",
+            Name=start.Name,
+            Ident=ident,
+            Region=start.Region,
+            Comment="START",
+            Pos=start.Pos.clone(),
+        )
 
         return self
 
@@ -349,8 +377,8 @@ class TransitBuilder:
         if self.flight_level is None:
             raise ValueError("Flight level must be set before setting TOC WP")
 
-        ident = f"{mins_secs_str(self.climb_performance_data.time_secs)}/FL{self.flight_level}/TOC"
-        pos = self._compute_pos(self.climb_performance_data, self.transit_segments[0])
+        ident = f"{mins_secs_str(self.climb_performance_data.time_secs)}/{self._fl_ident}/TOC"
+        pos = self._compute_pos(self.climb_performance_data, segment_idx=0)
 
         self.toc_wp = Waypoint(
             Type="WAYPOINT",
@@ -366,9 +394,9 @@ class TransitBuilder:
         """Computes and assigns intermediate waypoints for the transit route.
 
         This method calculates the intermediate waypoints based on the transit segments
-        and their associated timing and positional data. It iterates over the route
-        segments, determining the waypoint for each intermediate position while keeping
-        track of cumulative time.
+        and their associated timing and positional data. The arrival times at every
+        intermediate waypoint are precomputed in a single cumulative pass when the flight
+        level is set, and the waypoints are materialized from them here.
 
         The computed waypoints are stored in the `intermediate_wps` attribute of the
         TransitBuilder instance.
@@ -378,12 +406,12 @@ class TransitBuilder:
 
         Attributes Updated:
             intermediate_wps (list[Waypoint]): A list of computed intermediate waypoints,
-            deep-copied into the instance to prevent modifications to the original data.
+            each a clone of its segment's end waypoint.
 
         Notes:
             - The first segment is treated as containing the climb portion if it exists, and
               this impacts the calculation for that segment.
-            - The cumulative time is updated with the travel time for each segment as waypoints are computed.
+            - The arrival times are the cumulative sums of the segment travel times.
 
         Example:
             ```python
@@ -403,23 +431,18 @@ class TransitBuilder:
         """
         # TODO Validate initial conditions
 
-        intermediate_wps = []
-        cum_time_secs = 0
-
-        for idx, (this_segment, next_segment) in enumerate(
-            zip(self.transit_segments, self.transit_segments[1:], strict=False),
-        ):
-            has_climb = idx == 0
-            transit_wp, segment_time_secs = self._compute_intermediate_waypoint(
-                has_climb=has_climb,
+        self.intermediate_wps = [
+            self._compute_intermediate_waypoint(
                 this_segment=this_segment,
                 next_segment=next_segment,
-                cum_time_secs=cum_time_secs,
+                arrival_time_secs=arrival_time_secs,
             )
-            intermediate_wps.append(transit_wp)
-            cum_time_secs += segment_time_secs
-
-        self.intermediate_wps = deepcopy(intermediate_wps)
+            for (this_segment, next_segment), arrival_time_secs in zip(
+                pairwise(self.transit_segments),
+                self._arrival_times_secs,
+                strict=True,
+            )
+        ]
 
         return self
 
@@ -443,8 +466,8 @@ class TransitBuilder:
             and additional metadata.
 
         Notes:
-            - This method relies on the `_compute_tod_time_secs` helper for calculating
-              the time at which the descent begins.
+            - The time at which the descent begins is computed once by
+              `_compute_tod_time_secs` when the flight level is set.
             - The last segment of the transit route is used to determine the TOD position.
 
         Example:
@@ -465,14 +488,11 @@ class TransitBuilder:
         if self.flight_level is None:
             raise ValueError("Flight level must be set before setting TOD WP")
 
-        tod_time_secs = self._compute_tod_time_secs()
+        tod_time_secs = self._tod_time_secs
 
-        pos = self._compute_pos(
-            self.descent_performance_data,
-            self.transit_segments[-1],
-        )
+        pos = self._compute_pos(self.descent_performance_data, segment_idx=-1)
 
-        ident = f"{mins_secs_str(tod_time_secs)}/FL{self.flight_level}/TOD"
+        ident = f"{mins_secs_str(tod_time_secs)}/{self._fl_ident}/TOD"
 
         self.tod_wp = Waypoint(
             Type="WAYPOINT",
@@ -528,7 +548,7 @@ class TransitBuilder:
 
         segment = self.transit_segments[-1]
 
-        tod_time_secs = self._compute_tod_time_secs()
+        tod_time_secs = self._tod_time_secs
         descent_time_secs = self.descent_performance_data.time_secs
         transit_time_secs = tod_time_secs + descent_time_secs
 
@@ -536,14 +556,19 @@ class TransitBuilder:
             f"{mins_secs_str(transit_time_secs)}/{self.departure_bearing_mag:03}/LLEP"
         )
 
-        wp = deepcopy(segment.end)
-        wp.Type = "WAYPOINT"
-        wp.Name = "LLEP"
-        wp.Ident = ident
-        wp.Comment = "LLEP"
-        wp.Pos.Alt = self.route_alt_ft
+        end = segment.end
+        pos = Pos(
+            **{"@Lon": end.Pos.Lon, "@Lat": end.Pos.Lat, "@Alt": self.route_alt_ft}
+        )
 
-        self.end_wp = wp
+        self.end_wp = Waypoint(
+            Type="WAYPOINT",
+            Name="LLEP",
+            Ident=ident,
+            Region=end.Region,
+            Comment="LLEP",
+            Pos=pos,
+        )
 
         return self
 
@@ -611,19 +636,26 @@ class TransitBuilder:
 
         Attributes Updated:
             flight_level (int): The calculated flight level (nearest multiple of 10).
+            _fl_ident (str): The flight level as it appears in TOC and TOD idents, e.g. "FL200".
+            _alt_ft (int): The flight level altitude in feet, shared by every waypoint
+            raised to the flight level.
             climb_performance_data (object): Performance data for normal climb at the
             calculated flight level.
             descent_performance_data (object): Performance data for descent at the
             calculated flight level.
+            _tod_time_secs (float): The Top-of-Descent time, shared by `set_tod` and
+            `set_end`.
+            _arrival_times_secs (tuple[float, ...]): The cumulative arrival time at the
+            end of every segment but the last, read by `set_intermediate_wps`.
 
         Notes:
-            - The transit length is summed from all segments.
+            - The transit length is the total cached at initialization.
             - The bearing is computed to determine whether the flight is eastbound
               (0° to <180°) or westbound (180° to <360°):
                 - Eastbound flights use odd flight levels.
                 - Westbound flights use even flight levels.
-            - The flight level is computed from twice the transit length, ensuring it
-              adheres to the required odd/even convention using bitwise operations.
+            - The flight level is computed by `_compute_transit_fl` from twice the
+              transit length, ensuring it adheres to the required odd/even convention.
 
         Example:
             ```python
@@ -637,21 +669,12 @@ class TransitBuilder:
             print(builder.descent_performance_data)  # Output: Descent performance data
             ```
         """
-        transit_length = sum(segment.length for segment in self.transit_segments)
-        transit_bearing = _compute_transit_bearing(self.transit_segments)
-
-        transit_fl = int(2 * transit_length)
-
-        # Ensure flight level is odd or even based on transit_bearing
-        if 0 <= transit_bearing < 180:  # Eastbound (odd FL)
-            transit_fl = transit_fl | 1  # Force odd flight level (bitwise OR with 1)
-        elif 180 <= transit_bearing < 360:  # Westbound (even FL)
-            transit_fl = (
-                transit_fl & ~1
-            )  # Force even flight level (bitwise AND with bitwise NOT of 1)
-
-        # Convert to an actual FL (round to nearest multiple of 10 and divide by 10)
-        self.flight_level = (transit_fl // 10) * 10
+        self.flight_level = _compute_transit_fl(
+            self._total_length_nm,
+            _compute_transit_bearing(self._seg_bearings),
+        )
+        self._fl_ident = f"FL{self.flight_level}"
+        self._alt_ft = int(self.flight_level * 100)
         self.climb_performance_data = get_climb_descent_performance_data(
             JetOperation.NORMAL_CLIMB,
             self.flight_level,
@@ -660,6 +683,13 @@ class TransitBuilder:
             JetOperation.NAV_DESCENT,
             self.flight_level,
         )
+        self._tod_time_secs = self._compute_tod_time_secs()
+        self._arrival_times_secs = tuple(
+            accumulate(
+                self._compute_segment_time_secs(idx)
+                for idx in range(len(self.transit_segments) - 1)
+            ),
+        )
 
     def _compute_tod_time_secs(self) -> float:
         """Computes the Top-of-Descent (TOD) time in seconds.
@@ -720,7 +750,7 @@ class TransitBuilder:
     def _compute_pos(
         self,
         performance_data: ClimbDescentPerformanceData,
-        segment: Segment,
+        segment_idx: int,
     ) -> Pos:
         """Computes the position of a waypoint within a segment using performance data.
 
@@ -733,29 +763,29 @@ class TransitBuilder:
         Args:
             performance_data (object): An object containing performance details, including
             the distance traveled (in nautical miles) required to reach the waypoint.
-            segment (Segment): The segment along which the position is being computed.
+            segment_idx (int): The index in `transit_segments` of the segment along which
+            the position is being computed.
 
         Returns:
             Pos: A position object containing interpolated latitude, longitude, and
             altitude values. The altitude is set to the flight level (FL) multiplied by 100.
 
-        Raises:
-            ValueError: If the flight level (`flight_level`) is not set prior to calling
-            this method.
-
         Calculation Details:
             1. Computes the fraction of the segment covered by the waypoint using:
-               - `percent_of_leg = 1.0 - (performance_data.distance_nm / segment.length)`.
+               - `percent_of_leg = 1.0 - (performance_data.distance_nm / segment_length)`,
+                 where the segment length is read from the lengths cached at initialization.
             2. Uses the `interpolate_lat_lon_flat` function to find the latitude and
                longitude at the interpolated position along the segment.
-            3. Sets the altitude (`@Alt`) to the flight level (`flight_level`) multiplied
-               by 100, as it represents altitude in feet.
+            3. Sets the altitude (`@Alt`) to the flight level altitude in feet
+               (`_alt_ft`), computed once when the flight level is set.
 
         Notes:
-            - The flight level (`flight_level`) must already be initialized before calling
-              this method.
+            - The flight level is always set by the constructor, so it is not checked
+              again here.
             - This method assumes a flat-earth interpolation model using
               `interpolate_lat_lon_flat`.
+            - Only the TOC and TOD positions are interpolated, one per transit, so each is
+              a single scalar call rather than a batched computation.
 
         Example:
             ```python
@@ -764,7 +794,7 @@ class TransitBuilder:
             builder._set_flight_level_on_init()
             pos = builder._compute_pos(
                 performance_data=builder.climb_performance_data,
-                segment=segments[0],
+                segment_idx=0,
             )
 
             print(
@@ -772,29 +802,25 @@ class TransitBuilder:
             )  # Output: Pos object with interpolated latitude, longitude, and altitude
             ```
         """
-        if self.flight_level is None:
-            raise ValueError("FL must be set before setting END WP")
-
-        percent_of_leg = 1.0 - performance_data.distance_nm / segment.length
-        lat, lon = interpolate_lat_lon_flat(segment, percent_of_leg)
-        alt = int(self.flight_level * 100.0)
-
-        return Pos(**{"@Lon": lon, "@Lat": lat, "@Alt": alt})
+        percent_of_leg = (
+            1.0 - performance_data.distance_nm / self._seg_lengths[segment_idx]
+        )
+        lat, lon = interpolate_lat_lon_flat(
+            self.transit_segments[segment_idx],
+            percent_of_leg,
+        )
+        return Pos(**{"@Lon": lon, "@Lat": lat, "@Alt": self._alt_ft})
 
     def _compute_transit_distance_nm(self) -> float:
         """Computes the total transit distance in nautical miles (NM).
 
-        This private method calculates the sum of the lengths of all segments in the
-        transit route to determine the total transit distance. Each segment's length
-        is assumed to be provided in nautical miles.
+        This private method returns the sum of the lengths of all segments in the
+        transit route. The segment lengths and their total are computed once at
+        initialization, so repeated calls do not walk the segments again.
 
         Returns:
             float: The total transit distance in nautical miles.
 
-        Calculation Details:
-            - Iterates over the segments in `self.transit_segments`.
-            - Sums up the `length` attribute of each segment to compute the total distance.
-
         Example:
             ```python
             builder = TransitBuilder(transit_segments=segments)
@@ -803,108 +829,128 @@ class TransitBuilder:
             print(total_distance_nm)  # Output: Total transit distance in nautical miles
             ```
         """
-        return sum(segment.length for segment in self.transit_segments)
+        return self._total_length_nm
+
+    def _compute_segment_time_secs(self, idx: int) -> float:
+        """Computes the travel time along a transit segment.
+
+        The first segment contains the climb, so its time is the climb time plus the
+        time to cruise the remainder of the segment at the transit groundspeed.
+
+        Args:
+            idx (int): The index of the segment in `transit_segments`.
+
+        Returns:
+            float: The travel time in seconds. Segments without a climb are truncated
+            to whole seconds.
+        """
+        if idx == 0:
+            cruise_distance_nm = (
+                self._seg_lengths[0] - self.climb_performance_data.distance_nm
+            )
+            cruise_time_secs = 3600 * cruise_distance_nm / self.transit_groundspeed_kts
+            return cruise_time_secs + self.climb_performance_data.time_secs
+
+        return int((self._seg_lengths[idx] / self.transit_groundspeed_kts) * 3600)
 
     def _compute_intermediate_waypoint(
         self,
         *,
-        has_climb: bool,
         this_segment: Segment,
         next_segment: Segment,
-        cum_time_secs: int,
-    ) -> tuple[Waypoint, int]:
-        """Computes an intermediate waypoint and its associated travel time for a given segment.
+        arrival_time_secs: float,
+    ) -> Waypoint:
+        """Computes the intermediate waypoint at the end of a segment.
 
-        This private method calculates an intermediate waypoint's position, identifier,
-        and other attributes based on the traversed segment and the cumulative travel time.
-        The method accounts for whether the segment includes a climb phase, and adjusts
-        the flight time and waypoint attributes accordingly.
+        The waypoint is a copy of the segment's end waypoint, labelled with its arrival
+        time and departure bearing and raised to the transit flight level. The copy and
+        its new `Pos` are each made in a single `model_copy` step, rather than cloning
+        the waypoint and then mutating it.
 
         Args:
-            has_climb (bool): Indicates whether the segment includes a climb phase.
-            this_segment (Segment): The current segment from which the intermediate waypoint
-                is computed.
+            this_segment (Segment): The segment whose end waypoint is labelled.
             next_segment (Segment): The next segment in the route, used to determine
-                departure bearing.
-            cum_time_secs (int): The cumulative travel time (in seconds) prior to this segment.
+                the departure bearing.
+            arrival_time_secs (float): The cumulative travel time (in seconds) to the end
+                of this segment.
 
         Returns:
-            tuple[Waypoint, int]: A tuple containing:
-                - `Waypoint`: The computed intermediate waypoint, including position (`Pos`),
-                  type, identifier, and altitude.
-                - `int`: The total segment travel time (in seconds), including climb time if
-                  applicable.
-
-        Calculation Details:
-            - If `has_climb` is `True`:
-                - Calculates the cruise distance by subtracting the climb distance
-                  (`climb_performance_data.distance_nm`) from the segment's total length.
-                - Computes the cruise time based on transit groundspeed (`transit_groundspeed_kts`).
-                - Adds the climb time (`climb_performance_data.time_secs`) to the cruise time.
-            - If `has_climb` is `False`:
-                - Directly determines the segment travel time using the segment's length and
-                  transit groundspeed.
-            - The waypoint's identifier (`wp.Ident`) is constructed in the format:
-              `"<cumulative time in mins:secs>/<departure bearing>/<optional comment>"`.
-            - The altitude (`wp.Pos.Alt`) is set to the flight level (`flight_level`) multiplied by 100.
-
-        Attributes Updated on `Waypoint`:
-            - `Type`: Set to `"WAYPOINT"`.
-            - `Ident`: Populated with the formatted identifier.
-            - `Pos.Alt`: Altitude in feet, calculated as `flight_level * 100`.
-
-        Raises:
-            ValueError: If `flight_level` is not set before calling this method.
-
-        Notes:
-            - The method uses `self.transit_groundspeed_kts` to compute travel times.
-            - The `deepcopy` of the segment's end position ensures no mutation to the original object.
+            Waypoint: The computed intermediate waypoint. Its identifier has the format
+            `"<arrival time in mins:secs>/<departure bearing>/<optional comment>"`, and its
+            altitude is the flight level multiplied by 100.
 
         Example:
             ```python
             builder = TransitBuilder(transit_segments=segments)
-            builder._set_flight_level_on_init()
 
-            wp, segment_time = builder._compute_intermediate_waypoint(
-                has_climb=True,
+            wp = builder._compute_intermediate_waypoint(
                 this_segment=current_segment,
                 next_segment=next_segment,
-                cum_time_secs=1000,
+                arrival_time_secs=1000,
             )
 
             print(wp.Type)  # Output: WAYPOINT
-            print(wp.Ident)  # Output: "<cumulative time>/<bearing>/<optional comment>"
-            print(segment_time)  # Output: Travel time for the segment in seconds
+            print(wp.Ident)  # Output: "<arrival time>/<bearing>/<optional comment>"
             ```
         """
         departure_bearing = round(next_segment.true_bearing)
+        end = this_segment.end
 
-        # If this segment has a climb section, account for it in the duration calculation
-        if has_climb:
-            cruise_distance_nm = (
-                this_segment.length - self.climb_performance_data.distance_nm
-            )
-            cruise_time_secs = 3600 * cruise_distance_nm / self.transit_groundspeed_kts
-            climb_time_secs = self.climb_performance_data.time_secs
-            segment_time_secs = cruise_time_secs + climb_time_secs
+        # Format the ident in one step, with `mins_secs_str` inlined
+        mins, secs = divmod(int(arrival_time_secs), 60)
+        if end.Comment is None:
+            ident = f"{mins}:{secs:02}/{departure_bearing}"
         else:
-            segment_time_secs = int(
-                this_segment.travel_time_secs(self.transit_groundspeed_kts),
-            )
+            ident = f"{mins}:{secs:02}/{departure_bearing}/{end.Comment}"
+
+        return end.model_copy(
+            update={
+                "Type": "WAYPOINT",
+                "Ident": ident,
+                "Pos": end.Pos.model_copy(update={"Alt": self._alt_ft}),
+            },
+        )
 
-        wp = deepcopy(this_segment.end)
 
-        ident = (
-            f"{mins_secs_str(cum_time_secs + segment_time_secs)}/{departure_bearing}"
-        )
-        if wp.Comment is not None:
-            ident += f"/{wp.Comment}"
+def build_transit(args: TransitArgs) -> Transit:
+    """Builds a complete transit from a tuple of `TransitBuilder` arguments.
 
-        wp.Type = "WAYPOINT"
-        wp.Ident = ident
-        wp.Pos.Alt = self.flight_level * 100
+    The start, TOC, intermediate, TOD and end waypoints are all set before building.
+    Taking a single picklable tuple lets this function be mapped over a process pool.
 
-        return wp, segment_time_secs
+    Args:
+        args (TransitArgs): The `TransitBuilder` positional arguments.
+
+    Returns:
+        Transit: The fully built transit.
+    """
+    builder = TransitBuilder(*args)
+
+    return (
+        builder.set_start().set_toc().set_intermediate_wps().set_tod().set_end().build()
+    )
+
+
+def plan_transits(
+    transit_args: Iterable[TransitArgs],
+    max_workers: int | None = None,
+) -> list[Transit]:
+    """Builds many independent transits in parallel.
+
+    Each transit is built in a worker process by `build_transit`, so throughput for
+    batch planning scales with the number of cores. Single transits should call
+    `build_transit` directly to avoid the process start-up cost.
+
+    Args:
+        transit_args (Iterable[TransitArgs]): The `TransitBuilder` arguments for each transit.
+        max_workers (int | None): The number of worker processes. Defaults to the number
+            of CPUs.
+
+    Returns:
+        list[Transit]: The built transits, in the same order as `transit_args`.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(build_transit, transit_args))
 
 
 def _compute_transit_segments(route: list[Waypoint], id_entry: int) -> list[Segment]:
@@ -931,12 +977,13 @@ def _compute_transit_segments(route: list[Waypoint], id_entry: int) -> list[Segm
     Calculation Details:
         - Converts the 1-based `id_entry` index to a 0-based index (`idx_entry`).
         - Iterates over the waypoints in the route up to the waypoint at `idx_entry`.
-        - For each pair of consecutive waypoints, creates a `Segment` object using deep
-          copies of the waypoints to avoid unintended modifications.
+        - Clones each waypoint up to `idx_entry` once, then creates a `Segment` object
+          for each pair of consecutive clones.
 
     Notes:
         - The method ensures that created `Segment` objects are independent of the
-          original `route` by making deep copies of each waypoint.
+          original `route` by cloning each waypoint. Adjacent segments share the clone
+          of the waypoint that joins them.
         - Segments will not include the waypoint at `id_entry` or any subsequent
           waypoints.
 
@@ -962,131 +1009,116 @@ def _compute_transit_segments(route: list[Waypoint], id_entry: int) -> list[Segm
     if idx_entry < 0 or idx_entry >= len(route):
         raise ValueError("entry id must be between 0 and the number of waypoints")
 
-    segments = []
-    for i in range(0, idx_entry):
-        segments.append(Segment(deepcopy(route[i]), deepcopy(route[i + 1])))
+    # Clone each waypoint once; adjacent segments share the waypoint between them
+    waypoints = [wp.clone() for wp in route[: idx_entry + 1]]
 
-    return segments
+    return [Segment(start, end) for start, end in pairwise(waypoints)]
 
 
-def _compute_transit_fl(transit_segments: list[Segment]) -> int:
+def _compute_transit_fl(transit_length_nm: float, transit_bearing: int) -> int:
     """Computes the flight level (FL) for transit based on the total route length and bearing.
 
-    This private method calculates a suggested flight level (FL) for a set of transit segments.
-    The resulting FL is adjusted to be odd or even based on the overall bearing of the route,
-    following standard flight level rules (eastbound = odd, westbound = even). The flight level
-    is also rounded to the nearest multiple of 10.
+    This private method calculates a suggested flight level (FL) for a transit of the given
+    length and overall bearing. The resulting FL is adjusted to be odd or even based on the
+    bearing, following standard flight level rules (eastbound = odd, westbound = even). The
+    flight level is then rounded down to a multiple of 10.
 
     Args:
-        transit_segments (list[Segment]): A list of `Segment` objects representing the
-        transit route.
+        transit_length_nm (float): The total length of the transit route in nautical miles.
+        transit_bearing (int): The overall bearing of the transit route in degrees, in the
+            range [0, 360) as returned by `_compute_transit_bearing`.
 
     Returns:
         int: The computed flight level (FL), rounded and adjusted to the appropriate
         odd/even value based on bearing.
 
     Calculation Details:
-        - Summarizes the total length of all transit segments to determine the overall route length (`transit_length`).
-        - Calculates the route's overall bearing using `_compute_transit_bearing(transit_segments)`.
-        - Computes the initial flight level (`transit_fl`) based on twice the `transit_length`.
+        - Computes the initial flight level (`transit_fl`) based on twice the `transit_length_nm`.
         - Adjusts the flight level to ensure appropriate odd/even compliance based on the bearing:
             - Eastbound (0° ≤ bearing < 180°): FL must be odd.
-            - Westbound (180° ≤ bearing < 360°): FL must be even.
-        - Converts the result into an actual flight level by rounding it to the nearest multiple of 10.
+            - Otherwise (westbound): FL must be even.
+          Bit 0 is cleared and set from the eastbound flag, so no branch is needed.
+        - Converts the result into an actual flight level by rounding it down to a multiple of 10.
 
     Notes:
         - Even and odd flight levels are used for compliance with standard flight rules for IFR operations:
           - Eastbound (0° ≤ bearing < 180°): Odd flight levels.
           - Westbound (180° ≤ bearing < 360°): Even flight levels.
-        - The function ensures immutability of the input route, performing no modification on the segments.
+        - The length and bearing are plain numbers, so callers that have already
+          cached them, such as `TransitBuilder`, do not walk the segments again.
 
     Example:
         ```python
-        transit_segments = [
-            Segment(
-                start=Waypoint(lat=40.0, lon=-75.0),
-                end=Waypoint(lat=41.5, lon=-72.5),
-                length=120,
-            ),
-            Segment(
-                start=Waypoint(lat=41.5, lon=-72.5),
-                end=Waypoint(lat=43.0, lon=-70.0),
-                length=135,
-            ),
-        ]
-
-        builder = TransitBuilder()
-        transit_fl = builder._compute_transit_fl(transit_segments)
-        print(transit_fl)  # Output: A flight level value, e.g., 260
+        transit_fl = _compute_transit_fl(transit_length_nm=125.4, transit_bearing=45)
+        print(transit_fl)  # Output: 250
         ```
     """
-    transit_length = sum(segment.length for segment in transit_segments)
-    transit_bearing = _compute_transit_bearing(transit_segments)
-
-    transit_fl = int(2 * transit_length)
+    transit_fl = int(2 * transit_length_nm)
 
-    # Ensure flight level is odd or even based on transit_bearing
-    if 0 <= transit_bearing < 180:  # Eastbound (odd FL)
-        transit_fl = transit_fl | 1  # Force odd flight level (bitwise OR with 1)
-    elif 180 <= transit_bearing < 360:  # Westbound (even FL)
-        transit_fl = (
-            transit_fl & ~1
-        )  # Force even flight level (bitwise AND with bitwise NOT of 1)
+    # Ensure flight level is odd (eastbound) or even (westbound) by setting bit 0
+    eastbound = int(transit_bearing < 180)
+    transit_fl = (transit_fl & ~1) | eastbound
 
-    # Convert to an actual FL (round to nearest multiple of 10 and divide by 10)
+    # Convert to an actual FL (round down to a multiple of 10)
 
     return (transit_fl // 10) * 10
 
 
-def _compute_transit_bearing(transit_segments: list[Segment]) -> int:
-    """Computes the overall transit bearing for a set of segments.
+def _compute_transit_bearing(bearings: Iterable[int]) -> int:
+    """Computes the overall transit bearing from the bearings of its segments.
 
     This private method calculates the average or resultant bearing for a collection
     of transit segments by considering their individual bearings. The calculation
     combines the bearings into a single directional value using vector components.
 
     Args:
-        transit_segments (list[Segment]): A list of `Segment` objects representing
-        the transit route. Each `Segment` should have a `true_bearing` attribute.
+        bearings (Iterable[int]): The true bearing of each transit segment, in degrees.
 
     Returns:
         int: The overall bearing in degrees, as an integer between [0, 360).
 
     Calculation Details:
-        - For each segment, the `true_bearing` attribute (provided in degrees)
-          is converted to its corresponding unit vector components:
-            - X component: `cos(true_bearing in radians)`
-            - Y component: `sin(true_bearing in radians)`
-        - Sums up all X and Y components across the transit segments.
+        - Each bearing (provided in degrees) is converted to its corresponding
+          unit vector components:
+            - X component: `cos(bearing in radians)`
+            - Y component: `sin(bearing in radians)`
+        - The bearings are converted to radians in a single pass by multiplying by the
+          `_D2R` constant, which is exactly what `math.radians` computes, without its
+          call overhead. The X and Y components are then summed by mapping `math.cos`
+          and `math.sin` over them.
         - Computes the arctangent of the resultant vector's components using
           `atan2(y, x)`, which provides the overall directional angle in radians.
         - Converts radians to degrees and ensures the result is in the range [0, 360)
           using the modulo operator.
+        - When every bearing lies within `_PARALLEL_SPREAD_DEG` of the others, as on
+          a transit of nearly parallel legs, the trigonometry is skipped and the
+          arithmetic mean of the bearings is returned instead. The bearings are
+          measured as signed offsets from the first bearing, so legs either side
+          of north (e.g. 358° and 2°) average to north rather than south.
 
     Notes:
         - The overall bearing represents the composite direction of transit segments
           treated as vectors.
-        - The method assumes that the `true_bearing` attribute of each `Segment` is
-          set and valid.
+        - Taking bearings rather than segments lets `TransitBuilder` pass the bearings
+          it caches at initialization.
 
     Example:
         ```python
-        transit_segments = [
-            Segment(true_bearing=45),  # Segment with a bearing of 45°
-            Segment(true_bearing=135),  # Segment with a bearing of 135°
-            Segment(true_bearing=90),  # Segment with a bearing of 90°
-        ]
-
-        builder = TransitBuilder()
-        overall_bearing = builder._compute_transit_bearing(transit_segments)
+        overall_bearing = _compute_transit_bearing([45, 135, 90])
         print(overall_bearing)  # Output: Composite bearing as an integer in degrees
         ```
     """
-    x = sum(
-        math.cos(math.radians(segment.true_bearing)) for segment in transit_segments
-    )
-    y = sum(
-        math.sin(math.radians(segment.true_bearing)) for segment in transit_segments
-    )
+    bearings = tuple(bearings)
+
+    # Fast path: nearly parallel segments average to their arithmetic mean, measured
+    # from the first bearing so that the 359°/1° wrap is handled
+    if bearings:
+        offsets = [(bearing - bearings[0] + 180) % 360 - 180 for bearing in bearings]
+        if max(offsets) - min(offsets) < _PARALLEL_SPREAD_DEG:
+            return int((bearings[0] + sum(offsets) / len(offsets)) % 360)
+
+    bearings_rad = [bearing * _D2R for bearing in bearings]
+    x = sum(map(math.cos, bearings_rad))
+    y = sum(map(math.sin, bearings_rad))
 
     return int(math.degrees(math.atan2(y, x)) % 360)
@@ -4,10 +4,14 @@ Functions:
 - interpolate_lat_lon_flat: Calculate the latitude and longitude of a point along a flat-Earth segment.
 - mins_secs_str: Convert time in seconds to a minutes:seconds string format.
 - compute_departure_bearing: Calculate the departure bearing for a given waypoint.
+- compute_departure_bearings: Calculate the departure bearings for every waypoint in a route.
 """
 
+import functools
+from itertools import pairwise
+
 from src.deserialisers.little_navmap import Waypoint
-from src.route_processor.geo import Segment
+from src.route_processor.geo import Segment, compute_true_bearing
 
 
 def interpolate_lat_lon_flat(segment: Segment, percent: float) -> tuple[float, float]:
@@ -35,7 +39,8 @@ def interpolate_lat_lon_flat(segment: Segment, percent: float) -> tuple[float, f
             - `lon` (float): The interpolated longitude.
 
     Raises:
-        ValueError: If `percent` is not between 0.0 and 1.0 (inclusive).
+        ValueError: If `percent` is not between 0.0 and 1.0 (inclusive). The check is
+            skipped when Python runs with optimizations enabled (`python -O`).
 
     Calculation Details:
         - Uses linear interpolation for both latitude and longitude:
@@ -46,6 +51,9 @@ def interpolate_lat_lon_flat(segment: Segment, percent: float) -> tuple[float, f
     Notes:
         - As the function assumes a flat Earth, results may contain minor inaccuracies
           for segments spanning large distances or near the poles.
+        - No trigonometry is evaluated: the deltas come from the segment's cached
+          `delta_lat_lon`. Callers measure `percent` with the flat earth `Segment.length`,
+          so a great circle interpolation here would mix two earth models.
         - The function relies on the `Lat` and `Lon` attributes being present in the
           `start` and `end` points of the segment.
 
@@ -69,17 +77,14 @@ def interpolate_lat_lon_flat(segment: Segment, percent: float) -> tuple[float, f
         print(lat, lon)  # Output: 41.0, -74.0
         ```
     """
-    if not 0.0 <= percent <= 1.0:
+    if __debug__ and not 0.0 <= percent <= 1.0:
         raise ValueError("Percent argument must be between 0.0 and 1.0")
 
-    lat1 = segment.start.Pos.Lat
-    lat2 = segment.end.Pos.Lat
-    lon1 = segment.start.Pos.Lon
-    lon2 = segment.end.Pos.Lon
+    d_lat, d_lon = segment.delta_lat_lon
 
     # Linear interpolation
-    lat = lat1 + percent * (lat2 - lat1)
-    lon = lon1 + percent * (lon2 - lon1)
+    lat = segment.start.Pos.Lat + percent * d_lat
+    lon = segment.start.Pos.Lon + percent * d_lon
 
     return lat, lon
 
@@ -101,9 +106,10 @@ def mins_secs_str(time_in_seconds: int) -> str:
             - `SS` is the integer number of seconds, zero-padded to two digits.
 
     Calculation Details:
-        - Minutes are calculated by performing integer division of the input by 60.
-        - Seconds are calculated by taking the remainder of the total seconds when
-          divided by 60 (`time_in_seconds % 60`).
+        - The input is truncated to whole seconds, and a single `divmod` by 60 yields
+          both the minutes and the remaining seconds.
+        - The formatted strings are memoised by whole seconds, so times repeated across
+          plans are not reformatted.
         - The result is formatted as `MM:SS` using Python's string formatting,
           ensuring seconds are displayed as two digits.
 
@@ -131,8 +137,13 @@ def mins_secs_str(time_in_seconds: int) -> str:
         print(formatted_time)  # Output: "2:03"
         ```
     """
-    mins = int(time_in_seconds / 60)
-    secs = int(time_in_seconds % 60)
+    return _format_whole_secs(int(time_in_seconds))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_secs(whole_secs: int) -> str:
+    """Formats a whole number of seconds as `MM:SS`, memoised for `mins_secs_str`."""
+    mins, secs = divmod(whole_secs, 60)
 
     return f"{mins}:{secs:02}"
 
@@ -157,8 +168,9 @@ def compute_departure_bearing(route: list[Waypoint], wp_id: int) -> int:
     Calculation Details:
         - Extracts the starting waypoint (`start_wp`) using `wp_id` and the next
           waypoint (`end_wp`) using `wp_id + 1` from the route.
-        - Creates a `Segment` from `start_wp` to `end_wp`.
-        - Computes true bearing from the segment and rounds it to the nearest integer.
+        - Computes the true bearing between their positions with `compute_true_bearing`
+          and rounds it to the nearest integer, as `Segment.true_bearing` does, without
+          constructing a `Segment`.
 
     Raises:
         IndexError: If `wp_id + 1` is out of bounds for the `route` list, i.e., there
@@ -167,6 +179,8 @@ def compute_departure_bearing(route: list[Waypoint], wp_id: int) -> int:
     Notes:
         - The function assumes the provided `route` has a valid sequence of waypoints.
         - The bearing is calculated for the segment between `wp_id` and `wp_id + 1`.
+        - To read the bearings of many waypoints, call `compute_departure_bearings` once
+          and index the result.
 
     Example:
         ```python
@@ -186,8 +200,40 @@ def compute_departure_bearing(route: list[Waypoint], wp_id: int) -> int:
         print(dep_bearing)  # Output: Bearing in degrees between waypoints 1 and 2
         ```
     """
-    start_wp = route[wp_id]
-    end_wp = route[wp_id + 1]
-    departure_segment = Segment(start_wp, end_wp)
+    start_pos = route[wp_id].Pos
+    end_pos = route[wp_id + 1].Pos
+
+    return _rounded_true_bearing(start_pos.Lat, start_pos.Lon, end_pos.Lat, end_pos.Lon)
+
+
+def compute_departure_bearings(route: list[Waypoint]) -> list[int]:
+    """Computes the departure bearing from every waypoint in a route but the last.
+
+    This is the batched form of `compute_departure_bearing`: the positions are read
+    once and the bearing of each consecutive pair is computed in a single pass.
+
+    Args:
+        route (list[Waypoint]): A list of `Waypoint` objects that make up the route.
+
+    Returns:
+        list[int]: The true departure bearings in degrees, rounded to the nearest
+        integer. Element `i` is the bearing from waypoint `i` to waypoint `i + 1`, so
+        the list is one shorter than the route.
+
+    Example:
+        ```python
+        bearings = compute_departure_bearings(route)
+        print(bearings[1] == compute_departure_bearing(route, wp_id=1))  # Output: True
+        ```
+    """
+    coords = [(wp.Pos.Lat, wp.Pos.Lon) for wp in route]
+
+    return [
+        _rounded_true_bearing(lat1, lon1, lat2, lon2)
+        for (lat1, lon1), (lat2, lon2) in pairwise(coords)
+    ]
+
 
-    return round(departure_segment.true_bearing)
+def _rounded_true_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> int:
+    """The true bearing rounded as `Segment.true_bearing` rounds it."""
+    return round(compute_true_bearing(lat1, lon1, lat2, lon2) % 360)
@@ -1,8 +1,24 @@
 """A utility for dumping waypoints in a plan for testing."""
 
+import sys
+
 from conftest import data_path
 from src.deserialisers.little_navmap import LittleNavmap
 
+# Python representation of a waypoint; text fields are formatted with their repr
+_WAYPOINT_TEMPLATE = """Waypoint(
+        Name={name!r},
+        Ident={ident!r},
+        Type={type!r},
+        Region={region!r},
+        Comment={comment!r},
+        Pos=Pos(**{{
+            "@Lon": {lon},
+            "@Lat": {lat},
+            "@Alt": {alt}
+        }}),
+    )"""
+
 
 def process() -> None:
     """Processes a flight plan file to extract and format waypoint information.
@@ -26,7 +42,8 @@ def process() -> None:
             - Region
             - Comment (if any)
             - Geographic position (`Lon`, `Lat`, `Alt`).
-        5. Print the formatted waypoints as structured Python representations.
+        5. Write each formatted waypoint to standard output as it is produced, so the
+           whole listing is never held in memory at once.
 
         Output Format:
         --------------
@@ -67,22 +84,49 @@ def process() -> None:
     file_path = data_path() / "VFR Newcastle (EGNT) to Inverness (EGPE).lnmpln"
     plan = LittleNavmap.read(file_path)
 
-    print(  # noqa: T201 - Simple utility
-        ",\n".join(
-            f"""Waypoint(
-        Name={waypoint.Name!r},
-        Ident={waypoint.Ident!r},
-        Type={waypoint.Type!r},
-        Region={waypoint.Region!r},
-        Comment={waypoint.Comment!r},
-        Pos=Pos(**{{
-            "@Lon": {waypoint.Pos.Lon},
-            "@Lat": {waypoint.Pos.Lat},
-            "@Alt": {waypoint.Pos.Alt}
-        }}),
-    )"""
-            for waypoint in plan.Flightplan.Waypoints
-        ),
+    write = sys.stdout.write
+    for idx, waypoint in enumerate(plan.Flightplan.Waypoints):
+        if idx:
+            write(",\n")
+        pos = waypoint.Pos
+        write(
+            _render_waypoint(
+                waypoint.Name,
+                waypoint.Ident,
+                waypoint.Type,
+                waypoint.Region,
+                waypoint.Comment,
+                pos.Lon,
+                pos.Lat,
+                pos.Alt,
+            ),
+        )
+    write("\n")
+
+
+def _render_waypoint(
+    name: str | None,
+    ident: str,
+    type_: str,
+    region: str | None,
+    comment: str | None,
+    lon: float,
+    lat: float,
+    alt: int,
+) -> str:
+    """Render one waypoint's fields as its Python representation.
+
+    Taking the fields as plain values keeps attribute lookups out of the rendering.
+    """
+    return _WAYPOINT_TEMPLATE.format(
+        name=name,
+        ident=ident,
+        type=type_,
+        region=region,
+        comment=comment,
+        lon=lon,
+        lat=lat,
+        alt=alt,
     )
 
 
@@ -0,0 +1,18 @@
+"""Testing fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from src.deserialisers.little_navmap import LittleNavmap
+
+# The root `conftest.data_path` cannot be imported here: this module is also `conftest`
+DATA_PATH = Path(__file__).resolve().parent.parent / "data"
+
+
+@pytest.fixture(scope="session")
+def lnm_plan() -> LittleNavmap:
+    """Fixture for a flight plan, parsed once per test session."""
+    return LittleNavmap.read(
+        DATA_PATH / "VFR Newcastle (EGNT) to Inverness (EGPE).lnmpln",
+    )
@@ -1,17 +1,58 @@
 """Tests Little Navmap deserialiser functionality."""
 
-from conftest import data_path
-from src.deserialisers.little_navmap import LittleNavmap
+import io
 
+from src.deserialisers.little_navmap import LittleNavmap, serialize_to_xml
 
-def test_littlenavmap_read():
+
+def test_littlenavmap_read(lnm_plan):
     """Tests that `LittleNavmap.read` correctly parses a `.lnmpln` flight plan file.
 
     This function validates that the `LittleNavmap.read` method successfully reads and
     deserializes a flight plan file into a Python object, and verifies a specific
     property in the result to ensure the data is correctly parsed.
     """
-    file_path = data_path() / "VFR Newcastle (EGNT) to Inverness (EGPE).lnmpln"
-    plan = LittleNavmap.read(file_path)
+    assert lnm_plan.Flightplan.Header.FlightplanType == "VFR"
+
+
+def test_littlenavmap_write(lnm_plan, tmp_path):
+    """Tests that a written flight plan reads back unchanged.
+
+    The file is written to the test's own `tmp_path`, so tests running in parallel
+    workers never share an output file.
+    """
+    file_path = tmp_path / "plan.lnmpln"
+    lnm_plan.write(file_path)
+
+    assert LittleNavmap.read(file_path) == lnm_plan
+
+
+def test_littlenavmap_write_stream(lnm_plan):
+    """Tests that a flight plan can be written to an in-memory binary stream."""
+    buffer = io.BytesIO()
+    lnm_plan.write(buffer)
+
+    assert buffer.tell() > 0
+    assert buffer.getvalue() == serialize_to_xml(lnm_plan).encode("utf-8")
+
+
+def test_waypoint_clone(lnm_plan):
+    """Tests that `Waypoint.clone` returns an equal copy that can be modified independently."""
+    wp = lnm_plan.Flightplan.Waypoints[1]
+
+    clone = wp.clone()
+    assert clone == wp
+
+    clone.Ident = "CLONE"
+    clone.Pos.Alt = 500
+    assert wp.Ident != "CLONE"
+    assert wp.Pos.Alt != 500
+
+
+def test_serialize_to_xml_omits_none(lnm_plan):
+    """Tests that fields set to None are left out of the serialized XML."""
+    xml = serialize_to_xml(lnm_plan)
+    waypoints = lnm_plan.Flightplan.Waypoints
 
-    assert plan.Flightplan.Header.FlightplanType == "VFR"
+    assert "None" not in xml
+    assert xml.count("<Region>") == sum(wp.Region is not None for wp in waypoints)
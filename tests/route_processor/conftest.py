@@ -1,10 +1,17 @@
-"""Testing fixtures."""
+"""Testing fixtures.
+
+The fixtures are only read by the tests, so each is built once per test session.
+"""
 
 import pytest
 
 from src.deserialisers.little_navmap import Pos, Waypoint
 from src.route_processor.geo import Segment
-from src.route_processor.route_processor import ProcessorConfig, process_route
+from src.route_processor.route_processor import (
+    ProcessorConfig,
+    process_route_cached,
+    route_key,
+)
 
 montrose = Waypoint(
     Name="Montrose",
@@ -25,124 +32,57 @@ forfar = Waypoint(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def montrose_to_forfar():
     """Fixture for a segment representing a route from Edinburgh to Glasgow."""
     return Segment(montrose, forfar)
 
 
-@pytest.fixture
+# (Name, Ident, Type, Region, Comment, Lon, Lat, Alt) for each waypoint of the route
+ROUTE_WAYPOINTS = (
+    ("Newcastle", "EGNT", "AIRPORT", None, None, -1.689722, 55.038055, 266),
+    ("Saint Abbs", "SAB", "VOR", "EG", "112.5", -2.206336, 55.907513, 14480),
+    ("Montrose", "LLEP", "USER", None, None, -2.475614, 56.70507, 22000),
+    ("Forfar", "WP1", "USER", None, None, -2.92245, 56.632725, 22000),
+    ("Crathie", "WP2", "USER", None, None, -3.215497, 57.040005, 22000),
+    ("Braemar", "WP3", "USER", None, None, -3.483008, 56.991013, 22000),
+    ("Tummel", "WP4", "USER", None, None, -4.012328, 56.70752, 21005),
+    ("Rannoch", "WP5", "USER", None, None, -4.43118, 56.684898, 17440),
+    ("Loch Ericht", "WP6", "USER", None, None, -4.466886, 56.747452, 16428),
+    ("Dalwhinnie", "WP7", "USER", None, None, -4.247161, 56.93224, 13027),
+    ("Fort Augustus", "WP8", "USER", None, None, -4.67408, 57.136242, 8258),
+    (None, "CI05", "WAYPOINT", "EG", "ILS108.5/RW05", -4.328055, 57.41526, 3075),
+    ("Inverness", "EGPE", "AIRPORT", None, None, -4.0475, 57.5425, 31),
+)
+
+
+@pytest.fixture(scope="session")
 def route():
-    """Fixture for a route."""
+    """Fixture for a route.
+
+    The waypoint data is trusted, so the models are constructed without validation.
+    """
     return [
-        Waypoint(
-            Name="Newcastle",
-            Ident="EGNT",
-            Type="AIRPORT",
-            Region=None,
-            Comment=None,
-            Pos=Pos(**{"@Lon": -1.689722, "@Lat": 55.038055, "@Alt": 266}),
-        ),
-        Waypoint(
-            Name="Saint Abbs",
-            Ident="SAB",
-            Type="VOR",
-            Region="EG",
-            Comment="112.5",
-            Pos=Pos(**{"@Lon": -2.206336, "@Lat": 55.907513, "@Alt": 14480}),
-        ),
-        Waypoint(
-            Name="Montrose",
-            Ident="LLEP",
-            Type="USER",
-            Region=None,
-            Comment=None,
-            Pos=Pos(**{"@Lon": -2.475614, "@Lat": 56.70507, "@Alt": 22000}),
-        ),
-        Waypoint(
-            Name="Forfar",
-            Ident="WP1",
-            Type="USER",
-            Region=None,
-            Comment=None,
-            Pos=Pos(**{"@Lon": -2.92245, "@Lat": 56.632725, "@Alt": 22000}),
-        ),
-        Waypoint(
-            Name="Crathie",
-            Ident="WP2",
-            Type="USER",
-            Region=None,
-            Comment=None,
-            Pos=Pos(**{"@Lon": -3.215497, "@Lat": 57.040005, "@Alt": 22000}),
-        ),
-        Waypoint(
-            Name="Braemar",
-            Ident="WP3",
-            Type="USER",
-            Region=None,
-            Comment=None,
-            Pos=Pos(**{"@Lon": -3.483008, "@Lat": 56.991013, "@Alt": 22000}),
-        ),
-        Waypoint(
-            Name="Tummel",
-            Ident="WP4",
-            Type="USER",
-            Region=None,
-            Comment=None,
-            Pos=Pos(**{"@Lon": -4.012328, "@Lat": 56.70752, "@Alt": 21005}),
-        ),
-        Waypoint(
-            Name="Rannoch",
-            Ident="WP5",
-            Type="USER",
-            Region=None,
-            Comment=None,
-            Pos=Pos(**{"@Lon": -4.43118, "@Lat": 56.684898, "@Alt": 17440}),
-        ),
-        Waypoint(
-            Name="Loch Ericht",
-            Ident="WP6",
-            Type="USER",
-            Region=None,
-            Comment=None,
-            Pos=Pos(**{"@Lon": -4.466886, "@Lat": 56.747452, "@Alt": 16428}),
-        ),
-        Waypoint(
-            Name="Dalwhinnie",
-            Ident="WP7",
-            Type="USER",
-            Region=None,
-            Comment=None,
-            Pos=Pos(**{"@Lon": -4.247161, "@Lat": 56.93224, "@Alt": 13027}),
-        ),
-        Waypoint(
-            Name="Fort Augustus",
-            Ident="WP8",
-            Type="USER",
-            Region=None,
-            Comment=None,
-            Pos=Pos(**{"@Lon": -4.67408, "@Lat": 57.136242, "@Alt": 8258}),
-        ),
-        Waypoint(
-            Name=None,
-            Ident="CI05",
-            Type="WAYPOINT",
-            Region="EG",
-            Comment="ILS108.5/RW05",
-            Pos=Pos(**{"@Lon": -4.328055, "@Lat": 57.41526, "@Alt": 3075}),
-        ),
-        Waypoint(
-            Name="Inverness",
-            Ident="EGPE",
-            Type="AIRPORT",
-            Region=None,
-            Comment=None,
-            Pos=Pos(**{"@Lon": -4.0475, "@Lat": 57.5425, "@Alt": 31}),
-        ),
+        Waypoint.model_construct(
+            Name=name,
+            Ident=ident,
+            Type=type_,
+            Region=region,
+            Comment=comment,
+            Pos=Pos.model_construct(Lon=lon, Lat=lat, Alt=alt),
+        )
+        for name, ident, type_, region, comment, lon, lat, alt in ROUTE_WAYPOINTS
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def route_coords() -> tuple[tuple[float, ...], tuple[float, ...], tuple[int, ...]]:
+    """Fixture for the route's (lons, lats, alts), one contiguous tuple per axis."""
+    _, _, _, _, _, lons, lats, alts = zip(*ROUTE_WAYPOINTS, strict=True)
+    return lons, lats, alts
+
+
+@pytest.fixture(scope="session")
 def config():
     """Fixture for a route processor config."""
     return ProcessorConfig(
@@ -153,7 +93,7 @@ def config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def processed_route(route: list[Waypoint], config: ProcessorConfig) -> list[Waypoint]:
-    """Fixture for a processed route."""
-    return process_route(route, config)
+    """Fixture for a processed route, memoised on the (route, config) pair."""
+    return list(process_route_cached(route_key(route), config))
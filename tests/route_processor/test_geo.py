@@ -1,12 +1,19 @@
 """Tests for geo.py."""
 
-import pytest
+from itertools import pairwise
+
+from src.route_processor.geo import (
+    Segment,
+    compute_distance_and_bearing,
+    compute_flat_distance,
+    compute_true_bearing,
+)
 
 
 def test_length(montrose_to_forfar):
     """Tests that the length  is accurately calculated."""
     segment = montrose_to_forfar
-    assert segment.length == pytest.approx(15.4, abs=0.1)
+    assert round(segment.length, 1) == 15.4
 
 
 def test_true_bearing(montrose_to_forfar):
@@ -25,4 +32,50 @@ def test_travel_time(montrose_to_forfar):
     """Tests that the travel time is correctly calculated."""
     segment = montrose_to_forfar
     travel_time = segment.travel_time_secs(420)
-    assert travel_time == pytest.approx(132, abs=1)
+    assert round(travel_time) == 132
+
+
+def test_delta_lat_lon(montrose_to_forfar):
+    """Tests that the latitude and longitude deltas are correctly calculated."""
+    d_lat, d_lon = montrose_to_forfar.delta_lat_lon
+    assert round(d_lat, 4) == -0.0723
+    assert round(d_lon, 4) == -0.4468
+
+
+def test_kernels_match_segment(montrose_to_forfar):
+    """Tests that the coordinate kernels agree with the segment properties built on them."""
+    segment = montrose_to_forfar
+    coords = (
+        segment.start.Pos.Lat,
+        segment.start.Pos.Lon,
+        segment.end.Pos.Lat,
+        segment.end.Pos.Lon,
+    )
+    assert compute_flat_distance(*coords) == segment.length
+    assert round(compute_true_bearing(*coords)) == segment.true_bearing
+    assert compute_distance_and_bearing(*coords) == (
+        compute_flat_distance(*coords),
+        compute_true_bearing(*coords),
+    )
+
+
+def test_properties_are_cached(montrose_to_forfar):
+    """Tests that the geometric properties are computed once and then reused."""
+    segment = montrose_to_forfar
+    values = (segment.length, segment.true_bearing, segment.magnetic_bearing)
+
+    assert {"length", "true_bearing", "magnetic_bearing"} <= vars(segment).keys()
+    assert (segment.length, segment.true_bearing, segment.magnetic_bearing) == values
+
+
+def test_kernels_over_route_legs(route, route_coords):
+    """Tests that the kernels over the per-axis coordinates match every route leg."""
+    lons, lats, _ = route_coords
+    lengths = list(map(compute_flat_distance, lats[:-1], lons[:-1], lats[1:], lons[1:]))
+    bearings = list(map(compute_true_bearing, lats[:-1], lons[:-1], lats[1:], lons[1:]))
+
+    segments = [Segment(start, end) for start, end in pairwise(route)]
+    assert lengths == [segment.length for segment in segments]
+    assert [round(bearing) for bearing in bearings] == [
+        segment.true_bearing for segment in segments
+    ]
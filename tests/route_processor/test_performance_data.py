@@ -10,6 +10,7 @@ from src.route_processor.performance_data import (
     get_climb_descent_performance_data,
     get_ll_cruise_performance_data,
     get_ml_cruise_performance_data,
+    load_performance_table,
 )
 
 
@@ -126,3 +127,15 @@ def test_ml_cruise(operation, fl, expected):
     """Tests that medium level cruise performance data is computed correctly."""
     result = get_ml_cruise_performance_data(operation, fl)
     assert result == expected
+
+
+def test_performance_table_is_reused():
+    """Tests that repeated lookups reuse one prepared table without modifying it."""
+    table = load_performance_table(JetOperation.NORMAL_CLIMB)
+    expected = table.copy()
+
+    get_climb_descent_performance_data(JetOperation.NORMAL_CLIMB, 220)
+    get_climb_descent_performance_data(JetOperation.NORMAL_CLIMB, 200)
+
+    assert load_performance_table(JetOperation.NORMAL_CLIMB) is table
+    assert table.equals(expected)
@@ -5,6 +5,9 @@ import pytest
 from src.route_processor.route_processor import (
     _compute_route_segments,
     _compute_route_wps,
+    process_route,
+    process_route_cached,
+    route_key,
 )
 
 
@@ -62,6 +65,26 @@ class TestProcessedRoute:
         assert wp.Comment == expected["Comment"]
 
 
+class TestProcessRouteCached:
+    """Memoised route processor tests."""
+
+    def test_matches_process_route(self, route, config):
+        """Tests that the memoised processor returns the same waypoints as `process_route`."""
+        assert list(process_route_cached(route_key(route), config)) == process_route(
+            route,
+            config,
+        )
+
+    def test_cache_hit(self, route, config):
+        """Tests that a repeated (route, config) pair is served from the cache."""
+        key = route_key(route)
+        first = process_route_cached(key, config)
+        hits = process_route_cached.cache_info().hits
+
+        assert process_route_cached(key, config) is first
+        assert process_route_cached.cache_info().hits == hits + 1
+
+
 class TestRouteProcessingUtilities:
     """Route processing utilities tests."""
 
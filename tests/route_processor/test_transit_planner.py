@@ -4,7 +4,11 @@ import pytest
 
 from src.route_processor.transit_planner import (
     TransitBuilder,
+    _compute_transit_bearing,
+    _compute_transit_fl,
     _compute_transit_segments,
+    build_transit,
+    plan_transits,
 )
 
 
@@ -92,3 +96,61 @@ class TestTransitBuilderUtilities:
     def test_flight_level(self, transit_builder):
         """Tests that it computes the flight level correctly."""
         assert transit_builder.flight_level == 200
+
+    @pytest.mark.parametrize(
+        ("transit_length_nm", "transit_bearing", "expected"),
+        [(125.4, 45, 250), (125.4, 200, 250), (99.9, 0, 190), (100.0, 359, 200)],
+    )
+    def test_compute_transit_fl(self, transit_length_nm, transit_bearing, expected):
+        """Tests the flight level for eastbound and westbound transits."""
+        assert _compute_transit_fl(transit_length_nm, transit_bearing) == expected
+
+    @pytest.mark.parametrize(
+        ("bearings", "expected"),
+        [
+            ([10, 12], 11),
+            ([358, 2], 0),
+            ([1, 359, 0], 0),
+            ([45, 135, 90], 90),
+            ([350, 80], 35),
+        ],
+    )
+    def test_compute_transit_bearing(self, bearings, expected):
+        """Tests the overall bearing of parallel, wrapping and divergent legs."""
+        assert _compute_transit_bearing(bearings) == expected
+
+
+class TestBuildTransit:
+    """Whole-transit build tests."""
+
+    @pytest.fixture
+    def transit_args(self, route, config):
+        """Transit builder arguments for the route."""
+        transit_segments = _compute_transit_segments(route, config.id_entry)
+        return (
+            transit_segments,
+            config.transit_airspeed_kts,
+            config.route_alt_ft,
+            999,
+        )
+
+    def test_build_transit(self, transit_args):
+        """Tests that it sets every waypoint of the transit."""
+        transit = build_transit(transit_args)
+
+        assert transit.start_wp.Ident == "0:00/342"
+        assert transit.toc_wp.Ident == "3:48/FL200/TOC"
+        assert [wp.Ident for wp in transit.intermediate_wps] == ["7:19/350/112.5"]
+        assert transit.tod_wp.Ident == "10:33/FL200/TOD"
+        assert transit.end_wp.Ident == "13:33/999/LLEP"
+
+    def test_plan_transits(self, transit_args):
+        """Tests that transits built in worker processes match a direct build."""
+        expected = build_transit(transit_args)
+        transits = plan_transits([transit_args, transit_args], max_workers=2)
+
+        assert len(transits) == 2
+        for transit in transits:
+            assert transit.toc_wp == expected.toc_wp
+            assert transit.intermediate_wps == expected.intermediate_wps
+            assert transit.end_wp == expected.end_wp
@@ -0,0 +1,49 @@
+"""Tests for utils.py."""
+
+from itertools import pairwise
+
+import pytest
+
+from src.route_processor.geo import Segment
+from src.route_processor.utils import (
+    compute_departure_bearing,
+    compute_departure_bearings,
+    interpolate_lat_lon_flat,
+    mins_secs_str,
+)
+
+
+@pytest.mark.parametrize(
+    ("time_in_seconds", "expected"),
+    [
+        (0, "0:00"),
+        (45, "0:45"),
+        (60, "1:00"),
+        (125, "2:05"),
+        (123.987, "2:03"),
+        (3599.9, "59:59"),
+    ],
+)
+def test_mins_secs_str(time_in_seconds, expected):
+    """Tests that times are formatted as minutes and zero-padded seconds."""
+    assert mins_secs_str(time_in_seconds) == expected
+
+
+def test_compute_departure_bearings(route):
+    """Tests that the batched bearings match the single waypoint bearings."""
+    bearings = compute_departure_bearings(route)
+
+    assert len(bearings) == len(route) - 1
+    assert bearings == [
+        compute_departure_bearing(route, wp_id) for wp_id in range(len(route) - 1)
+    ]
+    assert bearings == [
+        Segment(start, end).true_bearing for start, end in pairwise(route)
+    ]
+
+
+@pytest.mark.parametrize("percent", [-0.1, 1.1])
+def test_interpolate_lat_lon_flat_rejects_percent(montrose_to_forfar, percent):
+    """Tests that a percent outside the segment is rejected."""
+    with pytest.raises(ValueError, match="between 0.0 and 1.0"):
+        interpolate_lat_lon_flat(montrose_to_forfar, percent)